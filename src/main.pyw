@@ -32,20 +32,24 @@ Base .keyclsound template (save as *.keyclsound):
 import customtkinter as ctk
 import subprocess
 import platform
+import shutil
 import os
 import threading
 import random
 import time
 import sys
 import json
+import logging
 from tkinter import messagebox, filedialog
 import pystray
 from pystray import MenuItem as item
 from PIL import Image
 import pygame
 import keyboard
-import glob
 import re
+import atexit
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 print('PLEASE MAKE SURE THAT YOU HAVE READ THE DOCUMENTATION BEFORE RUNNING. OTHERWISE, ERRORS WILL HAPPEN AND YOU WILL NOT KNOW HOW TO FIX THEM.')
 print('PLEASE MAKE SURE THAT YOU HAVE READ THE DOCUMENTATION BEFORE RUNNING. OTHERWISE, ERRORS WILL HAPPEN AND YOU WILL NOT KNOW HOW TO FIX THEM.')
@@ -62,29 +66,122 @@ try:
 except ImportError:
     requests = None
 
+# Optional fast JSON (C parser); stdlib json still works if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data):
+    """json.loads but via orjson when available (accepts str or bytes)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def _dumps(obj):
+    """json.dumps with indent=2, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _dumps_compact(obj):
+    """Compact dump for hot-path writes (settings) -- fewer bytes per flush."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+# DEBUG is suppressed by default, so these cost next to nothing in production
+log = logging.getLogger("keycl")
+
+# Resolved once at import so nothing re-reads the environment / home dir later
+USER_HOME = os.environ.get('USERPROFILE') or os.path.expanduser('~')
+KEYCL_DIR = os.path.join(USER_HOME, 'KeyCl')
+os.makedirs(KEYCL_DIR, exist_ok=True)
+
 GITHUB_CONTENTS_API = "https://api.github.com/repos/OptionallyBlueStudios/KeyCL/contents/sounds"
+# Pre-built listing of every package; one GET replaces the API listing + per-file fetches
+GITHUB_MANIFEST_URL = "https://raw.githubusercontent.com/OptionallyBlueStudios/KeyCL/main/sounds/manifest.json"
+
+# One shared session = keep-alive between calls instead of a fresh TLS handshake each time
+if requests is not None:
+    _SESSION = requests.Session()
+    _SESSION.headers.update({
+        "Accept-Encoding": "gzip",
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "KeyCL"
+    })
+else:
+    _SESSION = None
+
+
+# Compiled once so sanitize_filename skips the re cache lookup per call
+_SANITIZE_BAD = re.compile(r"[\\/:*?\"<>|]+")
+_SANITIZE_WS = re.compile(r"\s+")
+_WORD_RE = re.compile(r"\w+")
 
 
 def sanitize_filename(name: str) -> str:
-    name = name.strip()
-    name = re.sub(r"[\\/:*?\"<>|]+", "_", name)
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _SANITIZE_BAD.sub("_", name.strip())
+    name = _SANITIZE_WS.sub(" ", name).strip()
     return name or "sound"
 
 
+# On-disk cache of {url: {"etag": ..., "body": ...}} so re-opening the browser
+# turns full downloads into cheap 304s
+_META_CACHE_FILE = os.path.join(KEYCL_DIR, '.keycl_meta_cache.json')
+_META_CACHE_LOCK = threading.Lock()
+_meta_cache = None
+
+
+def _load_meta_cache():
+    global _meta_cache
+    if _meta_cache is None:
+        try:
+            with open(_META_CACHE_FILE, 'rb') as f:
+                _meta_cache = _loads(f.read())
+        except Exception:
+            _meta_cache = {}
+    return _meta_cache
+
+
+def _save_meta_cache():
+    try:
+        os.makedirs(os.path.dirname(_META_CACHE_FILE), exist_ok=True)
+        with open(_META_CACHE_FILE, 'w', encoding='utf-8') as f:
+            f.write(_dumps(_meta_cache))
+    except Exception:
+        pass
+
+
 def load_text(url: str, timeout=15):
-    r = requests.get(url, timeout=timeout)
+    """Fetch text with a conditional GET; a 304 reuses the cached body."""
+    cache = _load_meta_cache()
+    with _META_CACHE_LOCK:
+        entry = cache.get(url)
+    headers = {"If-None-Match": entry["etag"]} if entry and entry.get("etag") else None
+    r = _SESSION.get(url, headers=headers, timeout=timeout)
+    if r.status_code == 304 and entry is not None:
+        return entry.get("body", "")
     r.raise_for_status()
+    if r.headers.get("ETag"):
+        with _META_CACHE_LOCK:
+            cache[url] = {"etag": r.headers["ETag"], "body": r.text}
+            _save_meta_cache()
     return r.text
 
 
 def download_binary(url: str, dest_path: str, timeout=30):
-    with requests.get(url, stream=True, timeout=timeout) as r:
+    with _SESSION.get(url, stream=True, timeout=timeout) as r:
         r.raise_for_status()
         with open(dest_path, "wb") as f:
-            for chunk in r.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+            # Copy in C with 1 MiB chunks instead of looping in Python
+            r.raw.decode_content = True
+            shutil.copyfileobj(r.raw, f, length=1024 * 1024)
     return dest_path
 
 
@@ -97,7 +194,7 @@ def parse_keyclsound(text: str) -> dict:
     data = {}
     # Try JSON
     try:
-        data = json.loads(text)
+        data = _loads(text)
     except Exception:
         # Parse key: value lines
         for line in text.splitlines():
@@ -123,34 +220,99 @@ def parse_keyclsound(text: str) -> dict:
     return data
 
 
+def _make_library_item(name: str, raw_url: str, meta: dict) -> dict:
+    """Build a browser item with its search haystack + word set precomputed."""
+    hay = " ".join([meta.get("title", ""), meta.get("author", ""),
+                    " ".join(meta.get("tags", []))]).lower()
+    return {
+        "name": name,
+        "raw_url": raw_url,
+        "meta": meta,
+        "_hay": hay,
+        "_tokens": set(_WORD_RE.findall(hay))
+    }
+
+
 class SoundManager:
     """Handles sound loading and playback"""
 
+    SOUND_EXTENSIONS = frozenset({'.wav', '.mp3', '.ogg', '.m4a'})
+    DECODED_CACHE_MAX = 16  # keep at most this many decoded PCM buffers around
+
     def __init__(self):
-        # Lower buffer -> lower latency
-        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=256)
-        self.channel = pygame.mixer.Channel(0)  # dedicated channel for key sounds
-        self.sounds = {}
+        self.channel = None  # set once the mixer finishes initializing
+        self.sounds = {}  # name -> file path (decoded lazily)
+        self._decoded = OrderedDict()  # name -> pygame.mixer.Sound LRU, filled on first play
         self.volume = 0.5
         self.enabled = True
         self.current_sound = None
-        self.sounds_folder = os.path.join(os.environ.get('USERPROFILE', os.path.expanduser('~')), 'KeyCl')
-        os.makedirs(self.sounds_folder, exist_ok=True)
+        self.sounds_folder = KEYCL_DIR
+        self._sounds_dir_mtime = 0
         self.load_sounds()
+        # Mixer init can probe audio devices for hundreds of ms; overlap it with GUI startup
+        threading.Thread(target=self._ensure_mixer, daemon=True).start()
+
+    def _ensure_mixer(self):
+        """Initialize the pygame mixer and the dedicated key-sound channel"""
+        if self.channel is None:
+            # buffer=256 at 44.1 kHz is ~6 ms of latency per keystroke; smaller
+            # buffers mean more CPU wakeups, so don't go lower than this.
+            # Key samples are mono, so mix mono and halve the mixdown bandwidth.
+            pygame.mixer.init(frequency=44100, size=-16, channels=1, buffer=256)
+            # Plenty of mixing channels so rapid presses don't cut each other off
+            pygame.mixer.set_num_channels(32)
+            # Reserve channel 0 for keystrokes so find_channel never hands it out.
+            # Volume lives on the Sound objects, not the channel, so the fast
+            # path sounds identical to plays routed through find_channel.
+            pygame.mixer.set_reserved(1)
+            self.channel = pygame.mixer.Channel(0)  # dedicated channel for key sounds
 
     def load_sounds(self):
-        """Load all sound files from the sounds folder"""
+        """Index all sound files from the sounds folder (decoding happens on first play)"""
+        # One stat tells us whether anything changed since the last scan
+        try:
+            mtime = os.stat(self.sounds_folder).st_mtime_ns
+        except OSError:
+            # Folder vanished mid-run: behave like the old glob and list nothing
+            self.sounds.clear()
+            self._decoded.clear()
+            self._sounds_dir_mtime = 0
+            return
+        if mtime == self._sounds_dir_mtime:
+            return
+        self._sounds_dir_mtime = mtime
+
         self.sounds.clear()
-        sound_extensions = ['*.wav', '*.mp3', '*.ogg', '*.m4a']
+        self._decoded.clear()
 
-        for ext in sound_extensions:
-            for file_path in glob.glob(os.path.join(self.sounds_folder, ext)):
-                try:
-                    sound_name = os.path.splitext(os.path.basename(file_path))[0]
-                    sound = pygame.mixer.Sound(file_path)
-                    self.sounds[sound_name] = sound
-                except pygame.error as e:
-                    print(f"Could not load {file_path}: {e}")
+        # One scandir pass instead of one glob per extension
+        with os.scandir(self.sounds_folder) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                sound_name, ext = os.path.splitext(entry.name)
+                if ext.lower() not in self.SOUND_EXTENSIONS:
+                    continue
+                self.sounds[sound_name] = entry.path
+
+    def add_sound(self, file_path):
+        """Register a single new file without rescanning the whole folder"""
+        sound_name = os.path.splitext(os.path.basename(file_path))[0]
+        self.sounds[sound_name] = file_path
+        return sound_name
+
+    def _get_sound(self, sound_name):
+        """Decode a sound on first use and cache it (LRU, bounded)"""
+        sound = self._decoded.get(sound_name)
+        if sound is None:
+            sound = pygame.mixer.Sound(self.sounds[sound_name])
+            sound.set_volume(self.volume)
+            self._decoded[sound_name] = sound
+            if len(self._decoded) > self.DECODED_CACHE_MAX:
+                self._decoded.popitem(last=False)
+        else:
+            self._decoded.move_to_end(sound_name)
+        return sound
 
     def play_sound(self, sound_name=None, play_time=soundcutsoff, fade_time=500):
         """
@@ -159,28 +321,39 @@ class SoundManager:
         if not self.enabled:
             return
 
+        if self.channel is None:
+            return  # mixer still initializing
+
         if sound_name is None:
             sound_name = self.current_sound
 
         if sound_name and sound_name in self.sounds:
             try:
-                sound = self.sounds[sound_name]
-                sound.set_volume(self.volume)
-
-                # Get a free channel or fallback to channel 0
-                channel = pygame.mixer.find_channel()
-                if channel is None:
-                    channel = pygame.mixer.Channel(0)
+                sound = self._get_sound(sound_name)
+
+                if sound_name == self.current_sound:
+                    # Keystroke fast path: play straight on the reserved channel,
+                    # skipping SDL's free-channel search
+                    channel = self.channel
+                else:
+                    # Get a free channel or fallback to the reserved one
+                    channel = pygame.mixer.find_channel()
+                    if channel is None:
+                        channel = self.channel
 
                 # Play sound normally (no cutoff, no fadeout)
                 channel.play(sound, maxtime=play_time * 1000)
 
             except Exception as e:
-                print(f"Error playing sound {sound_name}: {e}")
+                log.debug("Error playing sound %s: %s", sound_name, e)
 
     def set_volume(self, volume):
         """Set playback volume (0.0 to 1.0)"""
         self.volume = max(0.0, min(1.0, volume))
+        # Push the new volume to already-decoded sounds once, here,
+        # instead of on every single play
+        for sound in self._decoded.values():
+            sound.set_volume(self.volume)
 
     def set_current_sound(self, sound_name):
         """Set the current sound to play"""
@@ -195,6 +368,11 @@ class SoundManager:
 class KeyboardHook:
     """Handles keyboard event monitoring"""
 
+    # Exact key names that shouldn't trigger a sound; a leading 'left '/'right '
+    # is stripped before the lookup so sided variants stay filtered too
+    _EXCLUDED = frozenset({'shift', 'ctrl', 'alt', 'alt gr', 'cmd', 'win',
+                           'windows', 'tab', 'caps lock'})
+
     def __init__(self, sound_manager):
         self.sound_manager = sound_manager
         self.enabled = True
@@ -216,67 +394,130 @@ class KeyboardHook:
 
     def _on_key_press(self, key):
         """Handle key press events"""
-        if self.enabled and self.hook_active:
-            # Filter out some keys to avoid excessive sound
-            excluded_keys = ['shift', 'ctrl', 'alt', 'cmd', 'win', 'tab', 'caps lock']
-            key_name = str(key).lower()
+        if not (self.enabled and self.hook_active):
+            return
 
-            if not any(excluded in key_name for excluded in excluded_keys):
-                now = time.perf_counter()
-                if (now - self._last_play_ts) >= self.min_interval:
-                    self.sound_manager.play_sound()
-                    self._last_play_ts = now
+        # Debounce first so bursts bail out before any string work
+        now = time.perf_counter()
+        if (now - self._last_play_ts) < self.min_interval:
+            return
+
+        # Filter out some keys to avoid excessive sound
+        key_name = key.name if hasattr(key, 'name') else str(key)
+        if key_name:
+            key_name = key_name.lower()
+            if key_name.startswith(('left ', 'right ')):
+                key_name = key_name.split(' ', 1)[1]
+            if key_name in self._EXCLUDED:
+                return
+
+        self.sound_manager.play_sound()
+        self._last_play_ts = now
+
+
+# Single source of truth for defaults (load_settings and reset share it)
+_DEFAULT_SETTINGS = {
+    'volume': 0.5,
+    'enabled': True,
+    'current_sound': None,
+    'theme': 'dark'
+}
 
 
 class SettingsManager:
     """Handles application settings persistence"""
 
     def __init__(self):
-        self.settings_file = os.path.join(os.environ.get('USERPROFILE', os.path.expanduser('~')), 'KeyCl', 'settings.json')
+        self.settings_file = os.path.join(KEYCL_DIR, 'settings.json')
+        self._save_timer = None
+        self._save_lock = threading.Lock()
         self.settings = self.load_settings()
+        # A debounced write still pending at exit must not be lost
+        atexit.register(self._flush_now)
 
     def load_settings(self):
         """Load settings from file"""
-        default_settings = {
-            'volume': 0.5,
-            'enabled': True,
-            'current_sound': None,
-            'theme': 'dark'
-        }
+        default_settings = dict(_DEFAULT_SETTINGS)
 
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    settings = json.load(f)
-                    # Merge with defaults to ensure all keys exist
-                    default_settings.update(settings)
+            # Read raw bytes straight into _loads; no exists() stat, no text decode wrapper
+            with open(self.settings_file, 'rb') as f:
+                settings = _loads(f.read())
+            # Merge with defaults to ensure all keys exist
+            default_settings.update(settings)
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            print(f"Error loading settings: {e}")
+            log.debug("Error loading settings: %s", e)
 
         return default_settings
 
     def save_settings(self):
-        """Save settings to file"""
+        """Save settings to file (write a temp file then os.replace so a crash can't tear it)"""
         try:
-            os.makedirs(os.path.dirname(self.settings_file), exist_ok=True)
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            tmp = self.settings_file + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(_dumps_compact(self.settings))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.settings_file)
         except Exception as e:
-            print(f"Error saving settings: {e}")
+            log.debug("Error saving settings: %s", e)
+
+    def _schedule_save(self):
+        """Coalesce rapid set() calls (e.g. a volume drag) into one disk write"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(0.5, self.save_settings)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def reset_to_defaults(self):
+        """Replace all settings with the defaults and write once"""
+        self.settings = dict(_DEFAULT_SETTINGS)
+        self._flush_now()
+
+    def _flush_now(self):
+        """Cancel any pending debounced write and save immediately (quit/atexit path)"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        self.save_settings()
 
     def get(self, key, default=None):
         return self.settings.get(key, default)
 
     def set(self, key, value):
+        if self.settings.get(key) == value:
+            return  # nothing changed, nothing to write
         self.settings[key] = value
-        self.save_settings()
+        self._schedule_save()
 
 
 class KeyCLApp:
+    _ENABLED_TEXT = "🔊 Enabled"
+    _DISABLED_TEXT = "🔇 Disabled"
+
     def __init__(self):
         self.root = None
         self.main_frame = None
         self.current_view = "home"
+        # Widgets created later in setup_gui; None-init so UI updates can use
+        # a plain `is not None` check instead of hasattr on the hot path
+        self.toggle_button = None
+        self.volume_display = None
+        self.status_label = None
+        self.current_sound_label = None
+        self.volume_label = None
+        # Shared textvariables (created in setup_gui once a Tk root exists);
+        # one var.set updates every label bound to it
+        self.status_var = None
+        self.current_sound_var = None
+        self.volume_pct_var = None
+        self.volume_text_var = None
+        self._volume_commit_job = None
         self.sound_manager = SoundManager()
         self.keyboard_hook = KeyboardHook(self.sound_manager)
         self.settings_manager = SettingsManager()
@@ -316,6 +557,16 @@ class KeyCLApp:
         self.root.title("KeyCL - Keyboard Sound Manager")
         self.root.minsize(900, 650)
 
+        # Bind labels to textvariables so updates are one var.set instead of
+        # a .configure per widget
+        pct = int(self.sound_manager.volume * 100)
+        current_sound = self.sound_manager.current_sound or "None selected"
+        self.status_var = ctk.StringVar(
+            value=self._ENABLED_TEXT if self.sound_manager.enabled else self._DISABLED_TEXT)
+        self.current_sound_var = ctk.StringVar(value=f"Active Sound: {current_sound}")
+        self.volume_pct_var = ctk.StringVar(value=f"{pct}%")
+        self.volume_text_var = ctk.StringVar(value=f"Volume: {pct}%")
+
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.hide_window)
 
@@ -346,10 +597,9 @@ class KeyCLApp:
         sidebar_title.pack(pady=(20, 30), padx=20)
 
         # Status indicator
-        status_text = "🔊 Enabled" if self.sound_manager.enabled else "🔇 Disabled"
         self.status_label = ctk.CTkLabel(
             self.sidebar,
-            text=status_text,
+            textvariable=self.status_var,
             font=ctk.CTkFont(size=12),
             text_color="green" if self.sound_manager.enabled else "red"
         )
@@ -393,9 +643,9 @@ class KeyCLApp:
         self.main_frame.pack(side="right", expand=True, fill="both", padx=(0, 10), pady=10)
 
     def clear_main_frame(self):
-        """Clear all widgets from main frame"""
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
+        """Clear the main frame by recreating it (one destroy instead of one per widget)"""
+        self.main_frame.destroy()
+        self.create_main_frame()
 
     def update_button_states(self, active_button):
         """Update button appearance to show active state"""
@@ -436,15 +686,13 @@ class KeyCLApp:
         )
         status_title.pack(pady=(10, 5))
 
-        current_sound = self.sound_manager.current_sound or "None selected"
         self.current_sound_label = ctk.CTkLabel(
-            status_frame, text=f"Active Sound: {current_sound}", font=ctk.CTkFont(size=14)
+            status_frame, textvariable=self.current_sound_var, font=ctk.CTkFont(size=14)
         )
         self.current_sound_label.pack(pady=5)
 
-        volume_text = f"Volume: {int(self.sound_manager.volume * 100)}%"
         self.volume_label = ctk.CTkLabel(
-            status_frame, text=volume_text, font=ctk.CTkFont(size=14)
+            status_frame, textvariable=self.volume_text_var, font=ctk.CTkFont(size=14)
         )
         self.volume_label.pack(pady=5)
 
@@ -520,6 +768,7 @@ class KeyCLApp:
         # Create scrollable frame
         self.sound_scroll_frame = ctk.CTkScrollableFrame(parent, height=400)
         self.sound_scroll_frame.pack(pady=10, padx=20, fill="both", expand=True)
+        self._sound_rows = {}
 
         sounds = self.sound_manager.get_sound_list()
 
@@ -534,77 +783,125 @@ class KeyCLApp:
 
         # Create sound buttons
         for sound_name in sounds:
-            sound_button_frame = ctk.CTkFrame(self.sound_scroll_frame)
-            sound_button_frame.pack(pady=5, padx=10, fill="x")
+            self._add_sound_row(sound_name)
 
-            # Sound name and select button
-            sound_label = ctk.CTkLabel(
-                sound_button_frame, text=sound_name, font=ctk.CTkFont(size=14)
-            )
-            sound_label.pack(side="left", padx=20, pady=10)
+    def _add_sound_row(self, sound_name):
+        """Create one row in the sound list and remember it for diff updates"""
+        sound_button_frame = ctk.CTkFrame(self.sound_scroll_frame)
+        sound_button_frame.pack(pady=5, padx=10, fill="x")
+        self._sound_rows[sound_name] = sound_button_frame
 
-            # Current sound indicator
-            if sound_name == self.sound_manager.current_sound:
-                current_indicator = ctk.CTkLabel(
-                    sound_button_frame, text="🎵", font=ctk.CTkFont(size=16)
-                )
-                current_indicator.pack(side="left", padx=5)
+        # Sound name and select button
+        sound_label = ctk.CTkLabel(
+            sound_button_frame, text=sound_name, font=ctk.CTkFont(size=14)
+        )
+        sound_label.pack(side="left", padx=20, pady=10)
 
-            # Buttons frame
-            button_frame = ctk.CTkFrame(sound_button_frame)
-            button_frame.pack(side="right", padx=10, pady=5)
+        # Current sound indicator
+        if sound_name == self.sound_manager.current_sound:
+            current_indicator = ctk.CTkLabel(
+                sound_button_frame, text="🎵", font=ctk.CTkFont(size=16)
+            )
+            current_indicator.pack(side="left", padx=5)
 
-            ctk.CTkButton(
-                button_frame, text="Test", width=60, height=30,
-                command=lambda name=sound_name: self.sound_manager.play_sound(name)
-            ).pack(side="right", padx=2)
+        # Buttons frame
+        button_frame = ctk.CTkFrame(sound_button_frame)
+        button_frame.pack(side="right", padx=10, pady=5)
 
-            ctk.CTkButton(
-                button_frame, text="Select", width=60, height=30,
-                command=lambda name=sound_name: self.select_sound(name)
-            ).pack(side="right", padx=2)
+        ctk.CTkButton(
+            button_frame, text="Test", width=60, height=30,
+            command=lambda name=sound_name: self.sound_manager.play_sound(name)
+        ).pack(side="right", padx=2)
+
+        ctk.CTkButton(
+            button_frame, text="Select", width=60, height=30,
+            command=lambda name=sound_name: self.select_sound(name)
+        ).pack(side="right", padx=2)
+
+    def _refresh_sound_rows(self):
+        """Update the visible list to match the library, touching only added/removed rows"""
+        current = set(self.sound_manager.get_sound_list())
+        shown = set(self._sound_rows)
+        for name in shown - current:
+            self._sound_rows.pop(name).destroy()
+        for name in current - shown:
+            self._add_sound_row(name)
 
     # -------- Online Library + .keyclsound Installers --------
 
     def browse_sound_library(self):
         """Browse and download sounds by scanning .keyclsound packages in the GitHub 'sounds' folder.
         Each .keyclsound is fetched, parsed, and the contained `url` is used to download the audio.
+        Fetching happens on a worker thread so the GUI stays responsive.
         """
         if requests is None:
             messagebox.showerror("Missing Dependency",
                                  "The 'requests' package is required.\nInstall it with:\n\npip install requests")
             return
+        threading.Thread(target=self._fetch_sound_library, daemon=True).start()
+
+    def _fetch_sound_library(self):
+        """Worker thread: fetch the library listing + package metadata, then open the browser window."""
+        # Try the pre-built manifest first: one raw GET instead of the rate-limited
+        # contents API plus a fetch per package
+        try:
+            manifest = _loads(load_text(GITHUB_MANIFEST_URL))
+        except Exception:
+            manifest = None
+
+        if manifest:
+            items = []
+            for entry in manifest:
+                meta = {
+                    "title": entry.get("title") or os.path.splitext(entry.get("name", "Untitled"))[0],
+                    "author": entry.get("author", ""),
+                    "description": entry.get("description", ""),
+                    "tags": entry.get("tags", []),
+                    "url": entry.get("audio_url", "")
+                }
+                items.append(_make_library_item(entry.get("name", ""), entry.get("url", ""), meta))
+            self.root.after(0, lambda: self._open_sound_browser(items))
+            return
+
         try:
-            resp = requests.get(GITHUB_CONTENTS_API, timeout=15)
-            resp.raise_for_status()
-            files = resp.json()
+            files = _loads(load_text(GITHUB_CONTENTS_API))
         except Exception as e:
-            messagebox.showerror("Network Error", f"Could not fetch library:\n{e}")
+            self.root.after(0, lambda e=e: messagebox.showerror("Network Error", f"Could not fetch library:\n{e}"))
             return
 
         # Only .keyclsound packages
         keycls = [f for f in files if f.get("name", "").lower().endswith(".keyclsound")]
         if not keycls:
-            messagebox.showinfo("No Packages", "No .keyclsound files were found in the online library.")
+            self.root.after(0, lambda: messagebox.showinfo("No Packages", "No .keyclsound files were found in the online library."))
             return
 
-        # Preload metadata for search/display (best effort)
-        items = []
-        for f in keycls:
-            meta = None
+        # Preload metadata for search/display (best effort, fetched in parallel)
+        def _safe_load(url):
             try:
-                text = load_text(f.get("download_url"))
-                meta = parse_keyclsound(text)
+                return load_text(url)
             except Exception:
-                # Fallback to filename-based meta if parsing fails
+                return None
+
+        with ThreadPoolExecutor(max_workers=16) as ex:
+            texts = list(ex.map(lambda f: _safe_load(f.get("download_url")), keycls))
+
+        items = []
+        for f, text in zip(keycls, texts):
+            meta = None
+            if text is not None:
+                try:
+                    meta = parse_keyclsound(text)
+                except Exception:
+                    meta = None
+            if meta is None:
+                # Fallback to filename-based meta if fetching/parsing fails
                 base = os.path.splitext(f.get("name", "Untitled"))[0]
                 meta = {"title": base, "author": "", "description": "", "tags": [], "url": ""}
-            items.append({
-                "name": f.get("name", ""),
-                "raw_url": f.get("download_url", ""),
-                "meta": meta
-            })
+            items.append(_make_library_item(f.get("name", ""), f.get("download_url", ""), meta))
 
+        self.root.after(0, lambda: self._open_sound_browser(items))
+
+    def _open_sound_browser(self, items):
         # Build a browser window
         win = ctk.CTkToplevel(self.root)
         win.title("Browse Online Sound Library (.keyclsound)")
@@ -615,21 +912,29 @@ class KeyCLApp:
         search_entry = ctk.CTkEntry(win, textvariable=search_var, placeholder_text="Search by title, author, or tag...")
         search_entry.pack(pady=10, padx=10, fill="x")
 
-        list_frame = ctk.CTkScrollableFrame(win)
-        list_frame.pack(pady=10, padx=10, fill="both", expand=True)
+        # Non-blocking status line for installs (no modal dialog to dismiss per install)
+        self._toast_label = ctk.CTkLabel(win, text="")
+        self._toast_label.pack(pady=(0, 8))
+
+        list_frame = None
 
         def render_list():
-            for w in list_frame.winfo_children():
-                w.destroy()
+            # Rebuild the container wholesale instead of destroying rows one by one
+            nonlocal list_frame
+            if list_frame is not None:
+                list_frame.destroy()
+            list_frame = ctk.CTkScrollableFrame(win)
+            list_frame.pack(pady=10, padx=10, fill="both", expand=True)
             query = search_var.get().strip().lower()
+            qtokens = set(_WORD_RE.findall(query))
 
             for it in items:
                 meta = it["meta"]
                 title = meta.get("title", os.path.splitext(it["name"])[0])
                 author = meta.get("author", "")
                 tags = meta.get("tags", [])
-                hay = " ".join([title, author, " ".join(tags)]).lower()
-                if query and query not in hay:
+                # Whole-word matches are C-level set ops; partial words fall back to substring
+                if qtokens and not (qtokens.issubset(it["_tokens"]) or query in it["_hay"]):
                     continue
 
                 row = ctk.CTkFrame(list_frame)
@@ -653,8 +958,14 @@ class KeyCLApp:
 
         render_list()
 
+        # Debounce so a burst of keystrokes collapses into one re-render
+        search_job = None
+
         def on_search_change(*_):
-            render_list()
+            nonlocal search_job
+            if search_job is not None:
+                win.after_cancel(search_job)
+            search_job = win.after(200, render_list)
 
         search_var.trace_add("write", on_search_change)
 
@@ -675,7 +986,8 @@ class KeyCLApp:
             messagebox.showerror("Install Failed", f"Could not install package:\n{e}")
 
     def install_keyclsound_from_metadata(self, meta: dict):
-        """Given parsed metadata, download the audio from meta['url'] and save a .keyclsound alongside it."""
+        """Given parsed metadata, download the audio from meta['url'] and save a .keyclsound alongside it.
+        The download itself runs on a worker thread so the GUI doesn't freeze."""
         url = meta.get("url", "").strip()
         title = sanitize_filename(meta.get("title", "Untitled Sound"))
 
@@ -687,6 +999,10 @@ class KeyCLApp:
                                  "The 'requests' package is required.\nInstall it with:\n\npip install requests")
             return
 
+        threading.Thread(target=self._do_install, args=(meta, url, title), daemon=True).start()
+
+    def _do_install(self, meta, url, title):
+        """Worker thread: download the audio + write the package, then update the UI via root.after."""
         try:
             # Decide a filename for the audio
             ext = os.path.splitext(url)[1].lower()
@@ -703,26 +1019,37 @@ class KeyCLApp:
             # Save .keyclsound file (JSON format)
             pkg_path = os.path.join(self.sound_manager.sounds_folder, f"{title}.keyclsound")
             with open(pkg_path, "w", encoding="utf-8") as f:
-                json.dump({
+                f.write(_dumps({
                     "title": meta.get("title", title),
                     "author": meta.get("author", ""),
                     "description": meta.get("description", ""),
                     "tags": meta.get("tags", []),
                     "url": url
-                }, f, indent=2)
-
-            # Reload and select as current
-            self.refresh_sounds()
-            # Select new one if present
-            base_name = os.path.splitext(os.path.basename(audio_filename))[0]
-            if base_name in self.sound_manager.sounds:
+                }))
+
+            # Register and select the new sound (back on the Tk thread)
+            def _finish():
+                # Just add the one file -- no full rescan/redraw of the library
+                base_name = self.sound_manager.add_sound(audio_path)
+                if self.current_view == "sounds" and base_name not in getattr(self, '_sound_rows', {}):
+                    self._add_sound_row(base_name)
                 self.select_sound(base_name)
+                self._show_toast(f"Installed: {title}")
 
-            messagebox.showinfo("Installed", f"Installed: {title}")
+            self.root.after(0, _finish)
 
         except Exception as e:
             if keycl_demode == False:
-                messagebox.showerror("Install Failed", f"Download or install failed:\n{e}")
+                self.root.after(0, lambda e=e: messagebox.showerror("Install Failed", f"Download or install failed:\n{e}"))
+
+    def _show_toast(self, message):
+        """Show a transient status line in the browse window; fall back to an info dialog."""
+        label = getattr(self, '_toast_label', None)
+        if label is not None and label.winfo_exists():
+            label.configure(text=message)
+            self.root.after(2500, lambda: label.winfo_exists() and label.configure(text=""))
+        else:
+            messagebox.showinfo("Installed", message)
 
     # -------- end installers --------
 
@@ -757,7 +1084,7 @@ class KeyCLApp:
         volume_slider.pack(pady=(0, 10), padx=20, fill="x")
 
         self.volume_display = ctk.CTkLabel(
-            settings_frame, text=f"{int(self.sound_manager.volume * 100)}%",
+            settings_frame, textvariable=self.volume_pct_var,
             font=ctk.CTkFont(size=12)
         )
         self.volume_display.pack(pady=(0, 20))
@@ -835,8 +1162,9 @@ Icon: Pixel Vectors by Vecteezy https://www.vecteezy.com/free-vector/pixel
     def open_sounds_folder(self):
         """Open the sounds folder"""
         try:
-            if platform.system() == "Windows":
-                subprocess.Popen(f'explorer "{self.sound_manager.sounds_folder}"')
+            if os.name == 'nt':
+                # No shell string to parse -- quote-safe and the fastest spawn on Windows
+                os.startfile(self.sound_manager.sounds_folder)
             elif platform.system() == "Darwin":  # macOS
                 subprocess.Popen(["open", self.sound_manager.sounds_folder])
             else:  # Linux
@@ -848,7 +1176,10 @@ Icon: Pixel Vectors by Vecteezy https://www.vecteezy.com/free-vector/pixel
         """Refresh the sound library"""
         self.sound_manager.load_sounds()
         if self.current_view == "sounds":
-            self.show_sounds_view()
+            if getattr(self, '_sound_rows', None):
+                self._refresh_sound_rows()
+            else:
+                self.show_sounds_view()
         self.update_home_status()
 
     def select_sound(self, sound_name):
@@ -874,7 +1205,7 @@ Icon: Pixel Vectors by Vecteezy https://www.vecteezy.com/free-vector/pixel
         self.settings_manager.set('enabled', self.sound_manager.enabled)
 
         # Update UI
-        if hasattr(self, 'toggle_button'):
+        if self.toggle_button is not None:
             self.toggle_button.configure(
                 text="Disable Sounds" if self.sound_manager.enabled else "Enable Sounds",
                 fg_color="red" if self.sound_manager.enabled else "green"
@@ -883,12 +1214,20 @@ Icon: Pixel Vectors by Vecteezy https://www.vecteezy.com/free-vector/pixel
         self.update_status_label()
 
     def update_volume(self, value):
-        """Update volume setting"""
+        """Update volume setting (display follows the drag; persistence waits for idle)"""
         self.sound_manager.set_volume(value)
+        pct = int(value * 100)  # computed once for both labels
+        if self.volume_pct_var is not None:
+            self.volume_pct_var.set(f"{pct}%")
+            self.volume_text_var.set(f"Volume: {pct}%")
+        # Commit to settings only once the slider has been idle for ~100 ms
+        if self._volume_commit_job is not None:
+            self.root.after_cancel(self._volume_commit_job)
+        self._volume_commit_job = self.root.after(100, lambda: self._commit_volume(value))
+
+    def _commit_volume(self, value):
+        self._volume_commit_job = None
         self.settings_manager.set('volume', value)
-        if hasattr(self, 'volume_display'):
-            self.volume_display.configure(text=f"{int(value * 100)}%")
-        self.update_home_status()
 
     def change_theme(self, theme):
         """Change application theme"""
@@ -901,38 +1240,31 @@ Icon: Pixel Vectors by Vecteezy https://www.vecteezy.com/free-vector/pixel
         """Reset all settings to default"""
         if messagebox.askyesno("Reset Settings", "Are you sure you want to reset all settings?"):
             # Reset to defaults
-            self.sound_manager.volume = 0.5
-            self.sound_manager.enabled = True
-            self.keyboard_hook.enabled = True
-            self.sound_manager.current_sound = None
+            self.sound_manager.volume = _DEFAULT_SETTINGS['volume']
+            self.sound_manager.enabled = _DEFAULT_SETTINGS['enabled']
+            self.keyboard_hook.enabled = _DEFAULT_SETTINGS['enabled']
+            self.sound_manager.current_sound = _DEFAULT_SETTINGS['current_sound']
 
             # Save defaults
-            self.settings_manager.settings = {
-                'volume': 0.5, 'enabled': True, 'current_sound': None, 'theme': 'dark'
-            }
-            self.settings_manager.save_settings()
+            self.settings_manager.reset_to_defaults()
 
             messagebox.showinfo("Settings Reset", "All settings have been reset to defaults!")
             self.show_settings_view()  # Refresh the settings view
 
     def update_status_label(self):
         """Update the sidebar status label"""
-        if hasattr(self, 'status_label'):
-            status_text = "🔊 Enabled" if self.sound_manager.enabled else "🔇 Disabled"
-            self.status_label.configure(
-                text=status_text,
-                text_color="green" if self.sound_manager.enabled else "red"
-            )
+        enabled = self.sound_manager.enabled
+        if self.status_var is not None:
+            self.status_var.set(self._ENABLED_TEXT if enabled else self._DISABLED_TEXT)
+        if self.status_label is not None:
+            self.status_label.configure(text_color="green" if enabled else "red")
 
     def update_home_status(self):
         """Update home view status displays"""
-        if hasattr(self, 'current_sound_label'):
+        if self.current_sound_var is not None:
             current_sound = self.sound_manager.current_sound or "None selected"
-            self.current_sound_label.configure(text=f"Active Sound: {current_sound}")
-
-        if hasattr(self, 'volume_label'):
-            volume_text = f"Volume: {int(self.sound_manager.volume * 100)}%"
-            self.volume_label.configure(text=volume_text)
+            self.current_sound_var.set(f"Active Sound: {current_sound}")
+            self.volume_text_var.set(f"Volume: {int(self.sound_manager.volume * 100)}%")
 
     def setup_window_size(self):
         """Handle window sizing"""
@@ -974,6 +1306,7 @@ Icon: Pixel Vectors by Vecteezy https://www.vecteezy.com/free-vector/pixel
     def quit_app(self):
         """Properly quit the application"""
         self.keyboard_hook.stop_hook()
+        self.settings_manager._flush_now()
         if self.root:
             self.root.quit()
 
@@ -983,27 +1316,29 @@ class TrayManager:
 
     def __init__(self, app):
         self.app = app
-        self.icon = None
-        self.setup_tray()
-
-    def setup_tray(self):
-        """Setup system tray icon"""
+        # Decode the tray icon once; menu rebuilds shouldn't re-read the PNG
         try:
             script_dir = os.path.dirname(os.path.abspath(__file__))
             icon_path = os.path.join(script_dir, "icon.png")
             if os.path.exists(icon_path):
-                image = Image.open(icon_path)
+                self._icon_image = Image.open(icon_path)
             else:
-                image = Image.new('RGB', (64, 64), color='blue')
+                self._icon_image = Image.new('RGB', (64, 64), color='blue')
         except Exception:
-            image = Image.new('RGB', (64, 64), color='blue')
+            self._icon_image = Image.new('RGB', (64, 64), color='blue')
+        # The Icon is created exactly once; dynamic labels/submenus mean the
+        # menu never needs rebuilding after run() starts
+        self.icon = pystray.Icon("KeyCL", self._icon_image, "KeyCL - Keyboard Sound Manager", self._build_menu())
 
+    def _build_menu(self):
+        """Build the tray menu (labels and the sound submenu are dynamic)"""
         # Build menu items in a list
         menu_items = [
             item("Open KeyCL", self.show_app),
             pystray.Menu.SEPARATOR,
             item(
-                "Enable Sounds" if not self.app.sound_manager.enabled else "Disable Sounds",
+                # Callable text -> label recomputes when the menu opens, no rebuild needed
+                lambda item: "Disable Sounds" if self.app.sound_manager.enabled else "Enable Sounds",
                 self.toggle_sounds
             ),
             item("Quick Volume", pystray.Menu(
@@ -1014,19 +1349,16 @@ class TrayManager:
             ))
         ]
 
-        # Add sound library submenu only if sounds exist
-        sound_list = self.app.sound_manager.get_sound_list()
-        if sound_list:
-            # Inside setup_tray
-            def make_setter(name):
-                def _set(icon, item):
-                    self.set_sound(name)
-                return _set
+        # Sound library submenu is a factory: pystray materializes it when the
+        # user actually opens it, so refreshes never rebuild the menu tree
+        def make_setter(name):
+            def _set(icon, item):
+                self.set_sound(name)
+            return _set
 
-            # Then when building the submenu:
-            menu_items.append(item("Sound Library", pystray.Menu(
-                *[item(sound_name, make_setter(sound_name)) for sound_name in sound_list[:10]]
-            )))
+        menu_items.append(item("Sound Library", pystray.Menu(
+            lambda: tuple(item(n, make_setter(n)) for n in self.app.sound_manager.get_sound_list()[:10])
+        )))
 
         # Add the rest
         menu_items.extend([
@@ -1038,20 +1370,24 @@ class TrayManager:
         ])
 
         # Build the actual menu
-        menu = pystray.Menu(*menu_items)
-
-        # Assign the icon
-        self.icon = pystray.Icon("KeyCL", image, "KeyCL - Keyboard Sound Manager", menu)
+        return pystray.Menu(*menu_items)
 
     def show_app(self, icon=None, item=None):
         """Show the main application window"""
-        threading.Thread(target=self.app.show_window).start()
+        root = self.app.root
+        if root is not None:
+            # Schedule on the Tk main loop: no thread spawned per click, and
+            # no Tk calls from the tray thread
+            root.after(0, self.app.show_window)
+        else:
+            # GUI not built yet (startup race) -- fall back to the old path
+            threading.Thread(target=self.app.show_window).start()
 
     def toggle_sounds(self, icon=None, item=None):
         """Toggle sound playback"""
         self.app.toggle_sounds()
-        # Recreate menu to update text
-        self.setup_tray()
+        # Dynamic label picks up the new state; just poke pystray
+        self.icon.update_menu()
 
     def set_volume(self, volume):
         """Set volume from tray"""
@@ -1065,8 +1401,8 @@ class TrayManager:
     def refresh_sounds(self, icon=None, item=None):
         """Refresh sound library"""
         self.app.refresh_sounds()
-        # Recreate menu to update sound list
-        self.setup_tray()
+        # Submenu factory re-lists sounds on open; no menu rebuild required
+        self.icon.update_menu()
 
     def open_sounds_folder(self, icon=None, item=None):
         """Open sounds folder from tray"""